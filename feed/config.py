@@ -18,6 +18,9 @@ class Settings(arxiv_base.Settings):
     STATIC_SERVER = os.environ.get("STATIC_SERVER", "static.arxiv.org")
 
     FEED_NUM_DAYS = os.environ.get("FEED_NUM_DAYS", consts.FEED_NUM_DAYS)
+    FEED_CACHE_TIMEOUT = os.environ.get("FEED_CACHE_TIMEOUT", consts.FEED_CACHE_TIMEOUT)
+    FEED_CACHE_SIZE = os.environ.get("FEED_CACHE_SIZE", consts.FEED_CACHE_SIZE)
+    FEED_CACHE_DOCUMENTS = os.environ.get("FEED_CACHE_DOCUMENTS", consts.FEED_CACHE_DOCUMENTS)
 
     ###add to the default URLS
     URLS: List[Tuple[str, str, str]] = [
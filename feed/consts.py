@@ -5,6 +5,9 @@ from feed.errors import FeedVersionError
 
 
 FEED_NUM_DAYS = 1
+FEED_CACHE_TIMEOUT = 300
+FEED_CACHE_SIZE = 64
+FEED_CACHE_DOCUMENTS = 10000
 UpdateActions = Literal['new', 'replace', 'absonly', 'cross', 'replace-cross']
 DELIMITER = "+"
 
@@ -3,16 +3,17 @@
 import logging
 from flask import current_app
 
-from feed import fetch_data
-from feed.domain import DocumentSet
+from feed import consts, fetch_data, utils
+from feed.consts import FeedVersion
+from feed.domain import AnnounceWindow, DocumentSet
 
 
 logger = logging.getLogger(__name__)
 
 
-def get_documents(query: str) -> DocumentSet:
+def get_announce_window(query: str) -> AnnounceWindow:
     """
-    Return the past day's RSS content from the specified XML serializer.
+    Validate the query and summarize the updates for the configured days.
 
     Parameters
     ----------
@@ -22,25 +23,63 @@ def get_documents(query: str) -> DocumentSet:
 
     Returns
     -------
-    DocumentSet
-        DocumentSet object populated with search results.
+    AnnounceWindow
+        The requested archives and categories, the days to list and a summary
+        of the updates in those days.
 
     Raises
     ------
     FeedError
-        Either FeedVersionError if the feed version is incorrect or
-        FeedIndexError if it fails to fetch the feed.
+        FeedIndexerError if the query is invalid.
     """
-    # Get the number of days for which results are to be returned
-    feed_num_days: str = current_app.config["FEED_NUM_DAYS"]
-    try:
-        days = int(feed_num_days)
-    except ValueError:
-        logger.error(
-            "Invalid configuration - FEED_NUM_DAYS: '%s'. Setting to 1.",
-            feed_num_days,
-        )
-        days = 1
+    return fetch_data.get_announce_window(query, _feed_num_days())
 
+
+def get_documents(window: AnnounceWindow) -> DocumentSet:
+    """
+    Return the documents announced in the window.
+
+    Parameters
+    ----------
+    window : AnnounceWindow
+        The window returned by :func:`get_announce_window`.
+
+    Returns
+    -------
+    DocumentSet
+        DocumentSet object populated with search results.
+    """
     # Get the search results, pass them to the serializer, return the results
-    return fetch_data.search(query, days)
+    return fetch_data.search(window)
+
+
+def get_etag(window: AnnounceWindow, version: FeedVersion) -> str:
+    """
+    Return the ETag of a feed without building it.
+
+    The window's days are part of the tag, so it changes when the window
+    moves as well as when updates in it are added or removed.
+
+    Parameters
+    ----------
+    window : AnnounceWindow
+        The window returned by :func:`get_announce_window`.
+    version : FeedVersion
+        Serialization format of the feed.
+
+    Returns
+    -------
+    str
+        ETag of the feed.
+    """
+    archive_ids = sorted(archive.id for archive in window.archives)
+    category_ids = sorted(category.id for category in window.categories)
+    return utils.etag(
+        f"{current_app.config['VERSION']} {version} {archive_ids} {category_ids} "
+        f"{window.first_day} {window.last_day} {window.latest} {window.count}"
+    )
+
+
+def _feed_num_days() -> int:
+    """Get the number of days for which results are to be returned."""
+    return utils.config_int("FEED_NUM_DAYS", consts.FEED_NUM_DAYS)
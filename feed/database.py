@@ -1,10 +1,9 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from datetime import date
 import logging 
 
-from sqlalchemy.orm import aliased
-from sqlalchemy.orm.query import Query
-from sqlalchemy import and_, or_, case, desc
+from sqlalchemy.orm import aliased, load_only
+from sqlalchemy import Select, and_, or_, case, desc, select
 from sqlalchemy.sql import func
 
 from arxiv.taxonomy.definitions import ARCHIVES_SUBSUMED
@@ -28,28 +27,34 @@ def get_announce_papers(first_day: date, last_day: date, archives: List[Archive]
             (up.action == 'cross', 1),
             (up.action == 'replace', 2),
         else_=3 
-    ).label('case_order')
+    )
  
     doc_ids=(
-        session.query(
+        select(
             up.document_id,
-            up.action
+            func.min(case_order).label('action_order') #action kept chosen by priority if multiple
         )
-        .filter(up.date.between(first_day, last_day))
-        .filter(up.action!="absonly")
-        .filter(or_(up.action != 'replace', up.version < version_threshold)) #replacements below a certain version
-        .filter(up.category.in_(category_list))
+        .where(up.date.between(first_day, last_day))
+        .where(up.action!="absonly")
+        .where(or_(up.action != 'replace', up.version < version_threshold)) #replacements below a certain version
+        .where(up.category.in_(category_list))
         .group_by(up.document_id) #one listings per paper
-        .order_by(case_order) #action kept chosen by priority if multiple
         .subquery() 
     )
 
+    action = case(
+            (doc_ids.c.action_order == 0, 'new'),
+            (doc_ids.c.action_order == 1, 'cross'),
+            (doc_ids.c.action_order == 2, 'replace'),
+        else_='absonly'
+    ).label('action')
+
     dc = aliased(DocumentCategory)
     #all listings for the specific category set
     all = (
-        session.query(
+        select(
             doc_ids.c.document_id, 
-            doc_ids.c.action,  
+            action,  
             func.max(dc.is_primary).label('is_primary')
         )
         .join(dc, dc.document_id == doc_ids.c.document_id)
@@ -78,17 +83,21 @@ def get_announce_papers(first_day: date, last_day: date, archives: List[Archive]
     #data for listings to be displayed
     meta = aliased(Metadata)
     result_query = (
-        session.query(
+        select(
             listing_type,
             meta
         )
         .join(meta, meta.document_id == all.c.document_id)
-        .filter(meta.is_current ==1)
+        .where(meta.is_current ==1)
+        .options(load_only( #only the columns used to create documents
+            meta.document_id, meta.paper_id, meta.version, meta.title, meta.abstract, meta.authors,
+            meta.abs_categories, meta.license, meta.doi, meta.journal_ref
+        ))
         .order_by(listing_order, meta.paper_id.desc())
         .limit(result_limit) 
     )
 
-    results=result_query.all()
+    results=session.execute(result_query).all()
     
     if len(results) <1:
         archive_ids = ', '.join(archive.id for archive in archives)
@@ -99,6 +108,21 @@ def get_announce_papers(first_day: date, last_day: date, archives: List[Archive]
 
     return results # type: ignore
 
+def get_announce_summary(first_day: date, last_day: date, archives: List[Archive], categories: List[Category])->Tuple[Optional[date], int]:
+    """returns the most recent update date and the number of updates for the listing window,
+    cheap enough to check whether a feed changed without building it
+    """
+    category_list=_all_possible_categories(archives, categories)
+    latest, count = session.execute(
+        select(
+            func.max(Updates.date),
+            func.count()
+        )
+        .where(Updates.date.between(first_day, last_day))
+        .where(Updates.category.in_(category_list))
+    ).one()
+    return latest, count
+
 def _all_possible_categories(archives:List[Archive], categories:List[Category]) -> List[str]:
     """returns a list of all category ids that may be relevant for list of archives and categories, 
     including aliases and previously subsumed archives
@@ -117,9 +141,9 @@ def _all_possible_categories(archives:List[Archive], categories:List[Category])
     return list(all)
 
 
-def _debug_no_response(msg:str, query: Query)->None:
+def _debug_no_response(msg:str, query: Select)->None:
     
-    actual_query=str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+    actual_query=str(query.compile(compile_kwargs={"literal_binds": True}))
     
     recent_entry = (
         session.query(Updates)
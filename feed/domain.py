@@ -1,12 +1,15 @@
 """Domain classes for the RSS feed."""
 
 from typing import List, Optional
+from datetime import date
 from dataclasses import dataclass
 
+from arxiv.taxonomy.category import Archive, Category
+
 from feed.consts import UpdateActions
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """Represents an e-print's author."""
 
@@ -16,7 +19,7 @@ class Author:
     affiliations: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents an feed item."""
 
@@ -31,7 +34,7 @@ class Document:
     journal_ref: Optional[str]
     update_type: UpdateActions
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSet:
     """A set of :class:`.Document`s for responding to a specific RSS feed."""
 
@@ -40,3 +43,20 @@ class DocumentSet:
 
     documents: List[Document]
     """Data for all the documents that were found by the search."""
+
+
+@dataclass(slots=True)
+class AnnounceWindow:
+    """The listings a feed request covers, summarized before any are fetched."""
+
+    archives: List[Archive]
+    categories: List[Category]
+    """The archives and categories that were requested."""
+
+    first_day: date
+    last_day: date
+    """Inclusive bounds of the announcement days to list."""
+
+    latest: Optional[date]
+    count: int
+    """Date of the most recent update in the window and the number of updates."""
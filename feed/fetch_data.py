@@ -1,32 +1,37 @@
 """Interface to Index Service for RSS feeds."""
 import logging
-from typing import List, Tuple
-from datetime import timedelta
+from time import monotonic
+from threading import Lock
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from datetime import date, timedelta
 
 from arxiv.taxonomy.category import Category, Archive
 from arxiv.taxonomy.definitions import ARCHIVES, CATEGORIES, ARCHIVES_ACTIVE
 from arxiv.authors import parse_author_affil
 from arxiv.db.models import Metadata
 
-from feed.utils import get_arxiv_midnight
+from feed import consts
+from feed.utils import config_int, get_arxiv_midnight
 from feed.errors import FeedIndexerError
 from feed.consts import DELIMITER, UpdateActions
-from feed.domain import Author, Document, DocumentSet
-from feed.database import get_announce_papers
+from feed.domain import AnnounceWindow, Author, Document, DocumentSet
+from feed.database import get_announce_papers, get_announce_summary
 
 logger = logging.getLogger(__name__)
 
-def search(query: str, days: int) -> DocumentSet:
-    """Search the index for records with the archive ID and dated within 24h.
+#built documents by listing window, archive and category ids and update summary, least recently used first
+_DocumentKey = Tuple[date, date, Tuple[str, ...], Tuple[str, ...], Optional[date], int]
+_document_cache: "OrderedDict[_DocumentKey, Tuple[float, List[Document]]]" = OrderedDict()
+_document_cache_lock = Lock()
+
+def search(window: AnnounceWindow) -> DocumentSet:
+    """Search the index for records in the announcement window.
 
     Parameters
     ----------
-    query : str
-        A concatenation of archive/category specifiers separated by delimiter
-        characters.
-    days : int
-        The number of days before the specified time for which to return
-        records.
+    window : AnnounceWindow
+        The requested archives and categories, and the days to list.
 
     Returns
     -------
@@ -34,21 +39,47 @@ def search(query: str, days: int) -> DocumentSet:
         The results as a collection of Documents.
 
     """
-    documents: List[Document] = []
-    archives,categories = validate_request(query)
-    records=get_records_from_db(archives,categories, days)
+    documents = _get_documents(window)
 
-    for record in records:
-        document = create_document(record)
-        documents.append(document)
-    
     topics=[]
-    for archive in archives:
+    for archive in window.archives:
         topics.append(archive.id)
-    for cat in categories:
+    for cat in window.categories:
         topics.append(cat.id)
     return DocumentSet(topics, documents) 
 
+def get_announce_window(query: str, days: int) -> AnnounceWindow:
+    """Validate a query and summarize the updates its feed would be built from.
+
+    Parameters
+    ----------
+    query : str
+        A concatenation of archive/category specifiers separated by delimiter
+        characters.
+    days : int
+        The number of days before the end date that identifies the
+        beginning of the filter window.
+
+    Raises
+    ------
+    FeedIndexerError
+        If the query is malformed or names an invalid archive or category.
+
+    Returns
+    -------
+    window : AnnounceWindow
+        The archives, categories and days of the feed, with the most recent
+        update date and number of updates in that window.
+
+    """
+    archives,categories = validate_request(query)
+    #start at the start of today
+    last_date=get_arxiv_midnight()
+    first_date=last_date - timedelta(days=days-1) #-1 for inclusive date bounds
+    first_day, last_day = first_date.date(), last_date.date()
+    latest, count = get_announce_summary(first_day, last_day, archives, categories)
+    return AnnounceWindow(archives, categories, first_day, last_day, latest, count)
+
 def validate_request(query: str) -> Tuple[List[Archive],List[Category]]:
     """Validate the provided archive/category specification.
 
@@ -128,31 +159,50 @@ def validate_request(query: str) -> Tuple[List[Archive],List[Category]]:
 
     return archives,categories
 
-def get_records_from_db(archives: List[Archive], categories: List[Category], days: int
-) -> List[Tuple[UpdateActions, Metadata]]:
-    """Retrieve all records that match the list of categories and date range.
-
-    Parameters
-    ----------
-    archives : List[str]
-        The archives that will be included in the search.
-    categories : List[str]
-        The categories that will be included in the search.
-    current_date_time : datetime
-        The date and time of the request.
-    days : int
-        The number of days before the end date that identifies the
-        beginning of the filter window.
-
-    Returns
-    -------
-    each row is a tuple of the AnnounceType literal and the metadata entry
+def _get_documents(window: AnnounceWindow) -> List[Document]:
+    """Return the documents for the listing window, reusing recently built ones.
 
+    The cache key includes the latest update date and update count of the
+    window, the same values the feed's ETag is derived from, so a cached list
+    is never served for a window whose updates have changed.
+    The cache holds at most FEED_CACHE_SIZE windows and FEED_CACHE_DOCUMENTS
+    documents in total, evicting the least recently used windows first.
     """
-    #start at the start of today
-    last_date=get_arxiv_midnight()
-    first_date=last_date - timedelta(days=days-1) #-1 for inclusive date bounds
-    return get_announce_papers(first_date.date(),last_date.date(), archives, categories)
+    key: _DocumentKey = (
+        window.first_day,
+        window.last_day,
+        tuple(sorted(archive.id for archive in window.archives)),
+        tuple(sorted(category.id for category in window.categories)),
+        window.latest,
+        window.count,
+    )
+    now = monotonic()
+    with _document_cache_lock:
+        cached = _document_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _document_cache.move_to_end(key)
+            return cached[1]
+
+    documents = [
+        create_document(record)
+        for record in get_announce_papers(window.first_day, window.last_day, window.archives, window.categories)
+    ]
+    expires = now + config_int("FEED_CACHE_TIMEOUT", consts.FEED_CACHE_TIMEOUT)
+    max_size = config_int("FEED_CACHE_SIZE", consts.FEED_CACHE_SIZE)
+    max_documents = config_int("FEED_CACHE_DOCUMENTS", consts.FEED_CACHE_DOCUMENTS)
+    if len(documents) > max_documents:
+        return documents #would evict everything else and still not fit
+
+    with _document_cache_lock:
+        for expired in [k for k, (until, _) in _document_cache.items() if until <= now]:
+            del _document_cache[expired]
+        _document_cache[key] = (expires, documents)
+        _document_cache.move_to_end(key)
+        total = sum(len(cached_documents) for _, cached_documents in _document_cache.values())
+        while len(_document_cache) > max_size or total > max_documents:
+            _, (_, evicted) = _document_cache.popitem(last=False)
+            total -= len(evicted)
+    return documents
 
 def create_document(record:Tuple[UpdateActions, Metadata])->Document:
     """Copy data from the provided database entires into a new Document and return it.
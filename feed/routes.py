@@ -1,8 +1,9 @@
 """URL routes for RSS feeds."""
-from typing import Union
+from typing import Optional, Union
 from datetime import timedelta
 
 from werkzeug import Response
+from werkzeug.http import is_resource_modified
 from flask import request, Blueprint, make_response, redirect, url_for, current_app
 
 from arxiv.taxonomy.definitions import ARCHIVES_ACTIVE
@@ -37,11 +38,19 @@ def _feed(query: str, version: Union[str, FeedVersion]) -> Response:
     -------
     response: Response
         Flask response object populated with the RSS or ATOM (XML) response for
-        the request and ETag header added.
+        the request and ETag header added, or an empty 304 response if the
+        request's conditional headers match the current feed.
     """
+    etag: Optional[str] = None
     try:
         version = FeedVersion.get(version)
-        documents = controller.get_documents(query)
+        window = controller.get_announce_window(query)
+        etag = controller.get_etag(window, version)
+        if not is_resource_modified(request.environ, etag=etag):
+            response: Response = make_response("", 304)
+            response.set_etag(etag, weak=True)
+            return _add_headers(response)
+        documents = controller.get_documents(window)
         feed = serialize(documents, query=query, version=version)
     except FeedVersionError as ex:
         feed = serialize(ex, query=query)
@@ -50,10 +59,18 @@ def _feed(query: str, version: Union[str, FeedVersion]) -> Response:
 
 
     # Create response object from data
-    response: Response = make_response(feed.content, feed.status_code)
+    response = make_response(feed.content, feed.status_code)
     # Set headers
-    response.headers["ETag"] = feed.etag
     response.headers["Content-Type"] = feed.content_type
+    if feed.status_code == 200 and etag is not None:
+        #feedgen stamps the build time into the content, so the etag is only weak
+        response.set_etag(etag, weak=True)
+    else:
+        response.set_etag(feed.etag)
+    return _add_headers(response)
+
+def _add_headers(response: Response) -> Response:
+    """Add the caching headers shared by full and 304 responses."""
     expiration_time = (get_arxiv_midnight() + timedelta(hours=24) - utc_now()).total_seconds() #expire on next day
     response.headers['Cache-Control'] = f"max-age={int(expiration_time)}"
     response.headers=add_surrogate_key(response.headers,["announce", "feed"]) 
@@ -1,5 +1,6 @@
 """Classes derived from the Feedgen extension classes."""
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from lxml import etree
 from lxml.etree import Element
@@ -7,6 +8,26 @@ from feedgen.ext.base import BaseEntryExtension, BaseExtension
 
 from feed.domain import Author
 
+_NS_ARXIV = "http://arxiv.org/schemas/atom"
+_NS_DC = "http://purl.org/dc/elements/1.1/"
+
+_TAG_ANNOUNCE_TYPE = f"{{{_NS_ARXIV}}}announce_type"
+_TAG_JOURNAL_REF = f"{{{_NS_ARXIV}}}journal_reference"
+_TAG_DOI = f"{{{_NS_ARXIV}}}DOI"
+_TAG_RIGHTS = f"{{{_NS_DC}}}rights"
+_TAG_CREATOR = f"{{{_NS_DC}}}creator"
+
+
+@lru_cache(maxsize=8192)
+def _creator_name(full_name: str, last_name: str, initials: str, affiliations: Tuple[str, ...]) -> str:
+    """Format one author for the dc:creator list, cached as authors recur across feeds."""
+    name = f'{full_name} {last_name}'
+    if initials:
+        name+=f" {initials}"
+    if affiliations:
+        name+= f" ({', '.join(affiliations)})"
+    return name
+
 
 class ArxivExtension(BaseExtension):
     """Extension of the Feedgen class to allow us to change its behavior."""
@@ -51,8 +72,8 @@ class ArxivExtension(BaseExtension):
             Definitions of the "arxiv" namespaces.
         """
         return {
-            "arxiv": "http://arxiv.org/schemas/atom",
-            "dc": "http://purl.org/dc/elements/1.1/"
+            "arxiv": _NS_ARXIV,
+            "dc": _NS_DC
         }
 
 
@@ -69,7 +90,7 @@ class ArxivAtomExtension(BaseEntryExtension):
             Definitions of the "arxiv" namespaces.
         """
         return {
-            "arxiv": "http://arxiv.org/schemas/atom",
+            "arxiv": _NS_ARXIV,
         }
 
 
@@ -78,25 +99,17 @@ class ArxivEntryExtension(BaseEntryExtension):
 
     def __init__(self: BaseEntryExtension):
         """Initialize the member values to all be empty."""
-        self.__arxiv_authors: List[Author] = []
-        self.__arxiv_license: Optional[str] = None
-        self.__arxiv_doi: Optional[str] = None
-        self.__arxiv_journal_ref: Optional[str] = None
-        self.__arxiv_announce_type: Optional[str] = None
+        self._arxiv_authors: List[Author] = []
+        self._arxiv_license: Optional[str] = None
+        self._arxiv_doi: Optional[str] = None
+        self._arxiv_journal_ref: Optional[str] = None
+        self._arxiv_announce_type: Optional[str] = None
 
     def __add_authors(self, entry: Element) -> None:
-        creator_element = etree.SubElement(
-            entry, "{http://purl.org/dc/elements/1.1/}creator"
+        etree.SubElement(entry, _TAG_CREATOR).text = ', '.join(
+            _creator_name(author.full_name, author.last_name, author.initials, tuple(author.affiliations))
+            for author in self._arxiv_authors
         )
-        full_text=''
-        for author in self.__arxiv_authors:
-            full_name = f'{author.full_name} {author.last_name}'
-            if author.initials:
-                full_name+=f" {author.initials}"
-            if author.affiliations:
-                full_name+= ' (' +', '.join(author.affiliations)  +')'        
-            full_text += f'{full_name}, '   
-        creator_element.text=full_text[:-2]
 
     def extend_atom(self, entry: Element) -> Element:
         """
@@ -114,28 +127,16 @@ class ArxivEntryExtension(BaseEntryExtension):
 
         """
 
-        if self.__arxiv_announce_type:
-            action=etree.SubElement(
-                    entry, "{http://arxiv.org/schemas/atom}announce_type"
-                )
-            action.text=self.__arxiv_announce_type
+        if self._arxiv_announce_type:
+            etree.SubElement(entry, _TAG_ANNOUNCE_TYPE).text = self._arxiv_announce_type
         
-        if self.__arxiv_license:
-            license=etree.SubElement(
-                    entry, "{http://purl.org/dc/elements/1.1/}rights"
-                )
-            license.text=self.__arxiv_license
-        if self.__arxiv_journal_ref:
-            journal_ref_element = etree.SubElement(
-                entry, "{http://arxiv.org/schemas/atom}journal_reference"
-            )
-            journal_ref_element.text = self.__arxiv_journal_ref
-
-        if self.__arxiv_doi:
-            doi=etree.SubElement(
-                    entry, "{http://arxiv.org/schemas/atom}DOI"
-                )
-            doi.text=self.__arxiv_doi
+        if self._arxiv_license:
+            etree.SubElement(entry, _TAG_RIGHTS).text = self._arxiv_license
+        if self._arxiv_journal_ref:
+            etree.SubElement(entry, _TAG_JOURNAL_REF).text = self._arxiv_journal_ref
+
+        if self._arxiv_doi:
+            etree.SubElement(entry, _TAG_DOI).text = self._arxiv_doi
 
         self.__add_authors(entry=entry)
 
@@ -156,27 +157,15 @@ class ArxivEntryExtension(BaseEntryExtension):
 
         """
         #add custom elements to entry structure
-        if self.__arxiv_announce_type:
-            action=etree.SubElement(
-                    entry, "{http://arxiv.org/schemas/atom}announce_type"
-                )
-            action.text=self.__arxiv_announce_type
+        if self._arxiv_announce_type:
+            etree.SubElement(entry, _TAG_ANNOUNCE_TYPE).text = self._arxiv_announce_type
         
-        if self.__arxiv_license:
-            license=etree.SubElement(
-                    entry, "{http://purl.org/dc/elements/1.1/}rights"
-                )
-            license.text=self.__arxiv_license
-        if self.__arxiv_doi:
-            doi=etree.SubElement(
-                    entry, "{http://arxiv.org/schemas/atom}DOI"
-                )
-            doi.text=self.__arxiv_doi
-        if self.__arxiv_journal_ref:
-            j_ref=etree.SubElement(
-                    entry, "{http://arxiv.org/schemas/atom}journal_reference"
-                )
-            j_ref.text=self.__arxiv_journal_ref
+        if self._arxiv_license:
+            etree.SubElement(entry, _TAG_RIGHTS).text = self._arxiv_license
+        if self._arxiv_doi:
+            etree.SubElement(entry, _TAG_DOI).text = self._arxiv_doi
+        if self._arxiv_journal_ref:
+            etree.SubElement(entry, _TAG_JOURNAL_REF).text = self._arxiv_journal_ref
         self.__add_authors(entry=entry)
         return entry
 
@@ -188,7 +177,7 @@ class ArxivEntryExtension(BaseEntryExtension):
         author : Author
             Paper author.
         """
-        self.__arxiv_authors=authors
+        self._arxiv_authors=authors
 
     def rights(self, text: str) -> None:
         """Assign the comment value to this entry.
@@ -200,13 +189,13 @@ class ArxivEntryExtension(BaseEntryExtension):
 
         """
         
-        self.__arxiv_license = text
+        self._arxiv_license = text
 
     def announce_type(self, text: str) -> None:
         """type of anouncement, options are: 'new', 'replace', 'absonly', 'cross', 'replace-cross'
         """
         
-        self.__arxiv_announce_type = text
+        self._arxiv_announce_type = text
 
     def journal_ref(self, text: str) -> None:
         """Assign the journal_ref value to this entry.
@@ -216,7 +205,7 @@ class ArxivEntryExtension(BaseEntryExtension):
         text : str
             The new journal_ref value.
         """
-        self.__arxiv_journal_ref = text
+        self._arxiv_journal_ref = text
 
     def doi(self, doi: str) -> None:
         """Assign the set of DOI definitions for this entry.
@@ -226,4 +215,4 @@ class ArxivEntryExtension(BaseEntryExtension):
         doi: str of DOI's for the document
 
         """
-        self.__arxiv_doi = doi
\ No newline at end of file
+        self._arxiv_doi = doi
\ No newline at end of file
@@ -6,8 +6,9 @@ from arxiv.db.models import Updates, Metadata
 from feed.domain import Document, Author
 from feed.factory import create_web_app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
+    #tests only read from the database, so one app and engine serve the whole run
     return create_web_app()
 
 
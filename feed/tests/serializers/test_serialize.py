@@ -116,4 +116,13 @@ def test_description_extras(app, documents):
     for version in FeedVersion.supported():
         feed = serialize(documents, "astro-ph", version=version)
         check_feed(feed, version=version)
-        assert b"arXiv:1234.5678v3 Announce Type: new \nAbstract:" in feed.content
\ No newline at end of file
+        assert b"arXiv:1234.5678v3 Announce Type: new \nAbstract:" in feed.content
+
+
+def test_creator_names(app, sample_doc, sample_author2):
+    sample_doc.authors.append(sample_author2)
+    documents = DocumentSet(categories=["astro-ph"], documents=[sample_doc, sample_doc])
+    for version in FeedVersion.supported():
+        feed = serialize(documents, "astro-ph", version=version)
+        check_feed(feed, version=version)
+        assert feed.content.count(b"<dc:creator>Very Real Sr. (Cornell University), L Emeno</dc:creator>") == 2
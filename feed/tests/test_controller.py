@@ -0,0 +1,30 @@
+from datetime import date
+from dataclasses import replace
+
+from arxiv.taxonomy.definitions import CATEGORIES, ARCHIVES
+
+from feed.controller import get_etag
+from feed.consts import FeedVersion
+from feed.domain import AnnounceWindow
+
+
+def test_etag_follows_window(app):
+    window = AnnounceWindow(
+        [ARCHIVES["math"]], [CATEGORIES["cs.CV"]],
+        date(2023, 10, 26), date(2023, 10, 27), date(2023, 10, 27), 6
+    )
+    with app.app_context():
+        etag = get_etag(window, FeedVersion.RSS_2_0)
+        assert etag == get_etag(replace(window), FeedVersion.RSS_2_0)
+        assert etag != get_etag(window, FeedVersion.ATOM_1_0)
+
+        #any change to the window or its updates changes the tag, even with the same latest date
+        for changed in [
+            replace(window, first_day=date(2023, 10, 27)),
+            replace(window, last_day=date(2023, 10, 28)),
+            replace(window, count=7),
+            replace(window, latest=date(2023, 10, 26)),
+            replace(window, archives=[]),
+            replace(window, categories=[]),
+        ]:
+            assert etag != get_etag(changed, FeedVersion.RSS_2_0)
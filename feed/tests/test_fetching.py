@@ -1,9 +1,13 @@
 import pytest
-from datetime import  date
+from datetime import  date, datetime
+from zoneinfo import ZoneInfo
+from unittest.mock import patch
 
 from feed.errors import FeedIndexerError
-from feed.fetch_data import validate_request,create_document
-from feed.database import get_announce_papers
+from feed import fetch_data
+from feed.domain import AnnounceWindow
+from feed.fetch_data import validate_request,create_document,search,get_announce_window
+from feed.database import get_announce_papers, get_announce_summary
 
 from arxiv.taxonomy.definitions import CATEGORIES, ARCHIVES
 
@@ -291,3 +295,94 @@ def test_db_announce_type_order(app):
             assert meta.paper_id < last_id
             last_id=meta.paper_id
 
+
+def test_db_action_priority(app):
+    #new on the first day and replace on the second, new takes priority
+    last_date=date(2023,10,26)
+    first_date=date(2023,10,25)
+    archive=[ARCHIVES["astro-ph"]]
+    with app.app_context():
+        items=get_announce_papers(first_date, last_date, archive,[])
+    item_found=False
+    for item in items:   
+        action, meta= item
+        if meta.document_id==12345:
+            item_found=True
+            assert action=="new"
+    assert item_found
+
+def test_db_announce_summary(app):
+    first_date=date(2023,10,25)
+    last_date=date(2023,10,27)
+    with app.app_context():
+        assert get_announce_summary(first_date, last_date, [], [cs_cv, CATEGORIES["math.NT"]]) == (date(2023,10,27), 9)
+        assert get_announce_summary(date(2022,10,25), date(2022,10,27), [], [cs_cv]) == (None, 0)
+
+@pytest.fixture
+def empty_document_cache():
+    fetch_data._document_cache.clear()
+    yield
+    fetch_data._document_cache.clear()
+
+@patch("feed.fetch_data.get_announce_papers")
+def test_search_reuses_documents(get_announce_papers, app, empty_document_cache):
+    get_announce_papers.return_value=[]
+    window=AnnounceWindow([math], [cs_cv], date(2023,10,26), date(2023,10,26), date(2023,10,26), 4)
+    with app.app_context():
+        search(window)
+        search(AnnounceWindow([math], [cs_cv], date(2023,10,26), date(2023,10,26), date(2023,10,26), 4))
+        assert get_announce_papers.call_count==1
+
+        #new updates in the window rebuild the documents
+        window.count=5
+        search(window)
+        assert get_announce_papers.call_count==2
+
+@patch("feed.fetch_data.get_announce_papers")
+def test_search_cache_size(get_announce_papers, app, empty_document_cache):
+    get_announce_papers.return_value=[]
+    with app.app_context():
+        size=int(app.config["FEED_CACHE_SIZE"])
+        for count in range(size+1):
+            search(AnnounceWindow([math], [], date(2023,10,26), date(2023,10,26), None, count))
+        assert len(fetch_data._document_cache)==size
+
+        #the oldest window was evicted
+        search(AnnounceWindow([math], [], date(2023,10,26), date(2023,10,26), None, 0))
+        assert get_announce_papers.call_count==size+2
+
+@patch("feed.fetch_data.create_document")
+@patch("feed.fetch_data.get_announce_papers")
+def test_search_cache_documents(get_announce_papers, create_document, app, empty_document_cache):
+    max_documents=app.config["FEED_CACHE_DOCUMENTS"]
+    app.config["FEED_CACHE_DOCUMENTS"]=5
+    try:
+        with app.app_context():
+            #a window larger than the limit is not stored
+            get_announce_papers.return_value=[("new", None)]*6
+            search(AnnounceWindow([math], [], date(2023,10,26), date(2023,10,26), None, 6))
+            assert len(fetch_data._document_cache)==0
+
+            #windows are evicted oldest first until the documents fit
+            get_announce_papers.return_value=[("new", None)]*3
+            search(AnnounceWindow([math], [], date(2023,10,26), date(2023,10,26), None, 3))
+            search(AnnounceWindow([cs], [], date(2023,10,26), date(2023,10,26), None, 3))
+            assert len(fetch_data._document_cache)==1
+            search(AnnounceWindow([cs], [], date(2023,10,26), date(2023,10,26), None, 3))
+            assert get_announce_papers.call_count==3
+    finally:
+        app.config["FEED_CACHE_DOCUMENTS"]=max_documents
+
+@patch("feed.fetch_data.get_arxiv_midnight")
+def test_announce_window(get_arxiv_midnight, app):
+    get_arxiv_midnight.return_value=datetime(2023,10,27,tzinfo=ZoneInfo("America/New_York"))
+    with app.app_context():
+        window=get_announce_window("cs.CV", 2)
+        assert (window.first_day, window.last_day) == (date(2023,10,26), date(2023,10,27))
+        assert (window.latest, window.count) == (date(2023,10,27), 6)
+        assert window.categories == [cs_cv] and window.archives == []
+
+        #the window slides to a single day and loses the updates of the 26th
+        window=get_announce_window("cs.CV", 1)
+        assert (window.first_day, window.last_day) == (date(2023,10,27), date(2023,10,27))
+        assert (window.latest, window.count) == (date(2023,10,27), 1)
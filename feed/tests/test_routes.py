@@ -29,17 +29,22 @@ def feed_atom() -> Feed:
     return Feed(content=b"content", version=FeedVersion.ATOM_1_0)
 
 
+@patch("feed.routes.controller.get_announce_window")
+@patch("feed.routes.controller.get_etag")
 @patch("feed.routes.controller.get_documents")
 @patch("feed.routes.serialize")
 def test_routes_ok(
     serialize,
     get_documents,
+    get_etag,
+    get_announce_window,
     client,
     documents: DocumentSet,
     feed_rss: Feed,
     feed_atom: Feed
 ):
     get_documents.return_value = documents
+    get_etag.return_value = "abc"
 
     for route, feed in [
         ("/rss/cs.LO", feed_rss),
@@ -48,19 +53,58 @@ def test_routes_ok(
     ]:
         serialize.return_value = feed
         response: Response = client.get(route)
-        get_documents.assert_called_with("cs.LO")
+        get_announce_window.assert_called_with("cs.LO")
+        get_documents.assert_called_with(get_announce_window.return_value)
         assert response.status_code == feed.status_code
         assert response.data == feed.content
-        assert response.headers["ETag"] == feed.etag
+        assert response.headers["ETag"] == 'W/"abc"'
+        assert "Last-Modified" not in response.headers
         assert response.headers["Content-Type"] == feed.content_type
 
 
+@patch("feed.routes.controller.get_announce_window")
+@patch("feed.routes.controller.get_etag")
+@patch("feed.routes.controller.get_documents")
+@patch("feed.routes.serialize")
+def test_routes_not_modified(
+    serialize, get_documents, get_etag, get_announce_window, client, documents: DocumentSet, feed_rss: Feed
+):
+    get_etag.return_value = "abc"
+
+    for headers in [
+        {"If-None-Match": 'W/"abc"'},
+        {"If-None-Match": '"abc"'},
+    ]:
+        response: Response = client.get("/rss/cs.LO", headers=headers)
+        assert response.status_code == 304
+        assert response.headers["ETag"] == 'W/"abc"'
+        assert response.data == b""
+    get_documents.assert_not_called()
+    serialize.assert_not_called()
+
+    #stale tags and dates alone rebuild the feed
+    get_documents.return_value = documents
+    serialize.return_value = feed_rss
+    for headers in [
+        {"If-None-Match": 'W/"old"'},
+        {"If-Modified-Since": "Thu, 26 Oct 2023 00:00:00 GMT"},
+    ]:
+        response = client.get("/rss/cs.LO", headers=headers)
+        assert response.status_code == 200
+        assert response.data == feed_rss.content
+        assert response.headers["ETag"] == 'W/"abc"'
+    get_documents.assert_called_with(get_announce_window.return_value)
+
+
+@patch("feed.routes.controller.get_announce_window")
+@patch("feed.routes.controller.get_etag")
 @patch("feed.routes.controller.get_documents")
 @patch("feed.routes.serialize")
 def test_routes_version_override(
-    serialize, get_documents, client, documents: DocumentSet, feed_rss: Feed
+    serialize, get_documents, get_etag, get_announce_window, client, documents: DocumentSet, feed_rss: Feed
 ):
     get_documents.return_value = documents
+    get_etag.return_value = "abc"
 
     for version, route, override in [
         # RSS 2.0 override
@@ -77,7 +121,8 @@ def test_routes_version_override(
         serialize.return_value = feed_rss
 
         client.get(route, headers={"VERSION": version})
-        get_documents.assert_called_with("cs.LO")
+        get_announce_window.assert_called_with("cs.LO")
+        get_documents.assert_called_with(get_announce_window.return_value)
         serialize.assert_called_with(documents, query="cs.LO", version=override)
 
 
@@ -3,7 +3,7 @@ from zoneinfo import ZoneInfo
 from datetime import timezone, datetime
 from unittest.mock import patch
 
-from feed.utils import utc_now, randomize_case, etag, get_arxiv_midnight
+from feed.utils import utc_now, randomize_case, etag, get_arxiv_midnight, config_int
 
 # utc_now
 def test_utc_now_timezone():
@@ -46,4 +46,11 @@ def test_get_arxiv_midnight(mock_datetime, app):
     with app.app_context():
         result = get_arxiv_midnight()
 
-    assert result == datetime(2023, 11, 9, 0, 0, 0, tzinfo=ZoneInfo("America/New_York"))
\ No newline at end of file
+    assert result == datetime(2023, 11, 9, 0, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+
+def test_config_int(app):
+    with app.app_context():
+        for value, expected in [("12", 12), (7, 7), ("bogus", 3), (None, 3)]:
+            app.config["TEST_CONFIG_INT"] = value
+            assert config_int("TEST_CONFIG_INT", 3) == expected
+    app.config.pop("TEST_CONFIG_INT")
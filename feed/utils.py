@@ -1,6 +1,7 @@
 import re
 import random
 import hashlib
+import logging
 from typing import Union
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
@@ -9,6 +10,8 @@ from flask import current_app
 from feed.consts import DELIMITER
 
 
+logger = logging.getLogger(__name__)
+
 # Get a random seed
 random.seed()
 
@@ -24,6 +27,21 @@ def get_arxiv_midnight() -> datetime:
     midnight=now.replace(hour=0, minute=0, second=0, microsecond=0)
     return midnight
 
+def config_int(key: str, default: int) -> int:
+    """Read an integer setting from the app config.
+
+    Settings come from the environment as strings, so an invalid value is
+    logged and replaced by the default rather than failing at import.
+    """
+    value = current_app.config[key]
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        logger.error(
+            "Invalid configuration - %s: '%s'. Setting to %s.", key, value, default
+        )
+        return default
+
 # Used only in tests
 
 UNICODE_LETTERS_RE = re.compile(r"[^\W\d_]", re.UNICODE)